@@ -25,7 +25,7 @@ logger = logging.getLogger(__name__)
 
 
 def main():
-    """Fetch and store events from all configured sources sequentially."""
+    """Fetch events from all configured sources concurrently and store them."""
     try:
         # Get enabled sources
         enabled_sources = get_enabled_sources()
@@ -35,15 +35,15 @@ def main():
             
         logger.info(f"Processing {len(enabled_sources)} enabled sources")
         
-        # Process each source sequentially
+        # Fetch from all sources concurrently, then store results sequentially
+        events_by_source = SourceManager.fetch_and_parse_all_sources(enabled_sources)
+        
         total_new = 0
         total_updated = 0
         
-        for source_id, registration in enabled_sources.items():
+        for source_id, events in events_by_source.items():
             logger.info(f"Processing source: {source_id}")
             
-            # Fetch events from the source
-            events = SourceManager.fetch_and_parse_single_source(source_id, registration)
             if not events:
                 logger.info(f"No events found from source: {source_id}")
                 continue
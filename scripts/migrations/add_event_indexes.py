@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Migration script to add indexes used by event queries and duplicate checks."""
+
+import os
+import sys
+from pathlib import Path
+import psycopg2
+from dotenv import load_dotenv
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+# Load environment variables
+load_dotenv()
+
+def run_migration():
+    """Add start_time and (source_name, start_time) indexes to events table."""
+    db_url = os.getenv('DATABASE_URL')
+    if not db_url:
+        print("Error: DATABASE_URL environment variable not set")
+        sys.exit(1)
+
+    conn = None
+    cur = None
+    try:
+        # Connect to the database
+        conn = psycopg2.connect(db_url)
+        cur = conn.cursor()
+
+        # Create the migration
+        print("Adding indexes to events table...")
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS ix_events_start_time
+            ON events (start_time);
+            
+            CREATE INDEX IF NOT EXISTS ix_events_source_name_start_time
+            ON events (source_name, start_time);
+        """)
+
+        # Commit the transaction
+        conn.commit()
+        print("Migration completed successfully!")
+
+    except psycopg2.Error as e:
+        print(f"Database error: {e}")
+        if conn:
+            conn.rollback()
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        if cur:
+            cur.close()
+        if conn:
+            conn.close()
+
+if __name__ == '__main__':
+    run_migration() 
@@ -4,12 +4,14 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 # Internal imports
 from src.config.environment import IS_PRODUCTION_ENVIRONMENT # ¿ Environment must be imported first ?
 from src.config.cors import CORS_CONFIG
 from src.utils.logging_config import setup_logging
 from src.db import db
+from src.config.external_services import close_openai_client
 from .routes import (
     brightdata_facebook_posts,
     brightdata_facebook_events,
@@ -34,7 +36,7 @@ async def lifespan(app: FastAPI):
         raise
     yield
     # Shutdown
-    # Add cleanup here if needed
+    close_openai_client()
 
 def create_application() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -49,6 +51,9 @@ def create_application() -> FastAPI:
 
     # Configure CORS
     app.add_middleware(CORSMiddleware, **CORS_CONFIG)
+    
+    # Compress larger responses (e.g. the /api/events list); small ones are sent as-is
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
     # Include health check router without prefix
     app.include_router(health.router)
@@ -2,12 +2,13 @@
 
 import logging
 from typing import Dict, Any
-from fastapi import APIRouter, HTTPException, Header, Body, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Header, BackgroundTasks, Request
 
 from ...models.event import Event
 from ...new_event_handler import process_new_events
 from ...utils.data_processors.facebook_post_processor_parser import process_facebook_post_scrape_data
 from ...config.external_services import verify_brightdata_auth
+from .brightdata_webhook_utils import is_brightdata_dead_page, read_brightdata_webhook_body
 
 logger = logging.getLogger(__name__)
 
@@ -16,16 +17,9 @@ router = APIRouter(
     tags=["brightdata"]
 )
 
-async def process_facebook_ifi_posts(data: dict):
-    """Process received IFI Facebook group posts data asynchronously, extracting any events."""
+def process_facebook_ifi_posts(data: dict):
+    """Process received IFI Facebook group posts data, extracting any events."""
     try:
-        # Check for "no posts" warning
-        if isinstance(data, list) and len(data) == 1:
-            first_item = data[0]
-            if isinstance(first_item, dict) and first_item.get('warning_code') == 'dead_page':
-                logger.info(f"No new posts found for the specified period: {first_item.get('warning')}")
-                return
-        
         # Convert list to dict if needed
         if isinstance(data, list):
             data = {"posts": data}
@@ -44,8 +38,8 @@ async def process_facebook_ifi_posts(data: dict):
 
 @router.post("/facebook-group/results")
 async def receive_facebook_ifi_posts(
+    request: Request,
     background_tasks: BackgroundTasks,
-    data: dict | list = Body(..., media_type="application/json"),
     authorization: str = Header(..., alias="Authorization")
 ):
     """
@@ -62,6 +56,9 @@ async def receive_facebook_ifi_posts(
                 detail="Invalid authorization header"
             )
         
+        # Parse the raw body (skips FastAPI's Body() validation of the payload)
+        data = await read_brightdata_webhook_body(request)
+        
         # Log incoming data for debugging (only if DEBUG level is enabled)
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Received Facebook IFI group posts data:")
@@ -69,6 +66,14 @@ async def receive_facebook_ifi_posts(
             logger.debug(f"Data keys (if dict): {data.keys() if isinstance(data, dict) else 'N/A'}")
             logger.debug(f"Data length (if list): {len(data) if isinstance(data, list) else 'N/A'}")
         
+        # An empty scrape arrives as a single warning item, so there is nothing to queue
+        if is_brightdata_dead_page(data):
+            logger.info(f"No new posts found for the specified period: {data[0].get('warning')}")
+            return {
+                "status": "success",
+                "message": "No posts in BrightData payload"
+            }
+        
         # Add processing task to background tasks
         background_tasks.add_task(process_facebook_ifi_posts, data)
         
@@ -78,6 +83,8 @@ async def receive_facebook_ifi_posts(
             "message": "Facebook IFI group posts received and queued for processing"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error handling Facebook IFI group posts: {e}")
         raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
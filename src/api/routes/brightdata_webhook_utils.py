@@ -0,0 +1,35 @@
+"""Shared helpers for the BrightData webhook routes."""
+
+import json
+from fastapi import HTTPException, Request
+
+def is_brightdata_dead_page(data: dict | list) -> bool:
+    """Check if a webhook payload is BrightData's single "dead_page" warning item (nothing was scraped)."""
+    if isinstance(data, list) and len(data) == 1:
+        first_item = data[0]
+        return isinstance(first_item, dict) and first_item.get('warning_code') == 'dead_page'
+    return False
+
+async def read_brightdata_webhook_body(request: Request) -> dict | list:
+    """
+    Read and parse a BrightData webhook body as JSON.
+    
+    Parsing the raw body directly avoids FastAPI's Body() validation, which
+    walks the whole (potentially large) payload.
+    
+    Args:
+        request: The incoming webhook request
+    
+    Returns:
+        The parsed JSON object or array
+    
+    Raises:
+        HTTPException: 400 if the body is not valid JSON or not an object/array
+    """
+    try:
+        data = json.loads(await request.body())
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    if not isinstance(data, (dict, list)):
+        raise HTTPException(status_code=400, detail="Expected a JSON object or array")
+    return data
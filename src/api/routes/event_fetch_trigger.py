@@ -1,5 +1,6 @@
 """Routes for triggering event fetches from external sources."""
 
+import hmac
 import os
 import subprocess
 from pathlib import Path
@@ -26,10 +27,12 @@ class AdminConfig:
         return True
     
     def verify_auth(self, auth_header: str) -> bool:
-        """Verify admin authorization header."""
-        return bool(auth_header and auth_header == self.api_key)
+        """Verify admin authorization header (constant-time comparison)."""
+        if not auth_header or not self.api_key:
+            return False
+        return hmac.compare_digest(auth_header.encode('utf-8'), self.api_key.encode('utf-8'))
 
-async def execute_fetch_script():
+def execute_fetch_script():
     """Execute the script that fetches events from all sources."""
     try:
         script_path = Path(__file__).parent.parent.parent.parent / 'scripts' / 'get_new_data.py'
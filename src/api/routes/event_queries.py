@@ -1,20 +1,20 @@
 """Event query routes for the FastAPI application."""
 
-from datetime import datetime
 from fastapi import APIRouter, HTTPException
 from typing import List, Dict, Any
 
 from ...db import db
 from ...models.event import Event
+from ...utils.timezone import now_oslo
 
 router = APIRouter(tags=["events"])
 
 @router.get("/events")
-async def get_active_events() -> List[Dict[str, Any]]:
+def get_active_events() -> List[Dict[str, Any]]:
     """Get all future and ongoing events that are not duplicates (no parent_id)."""
     try:
         with db.session() as session:
-            now = datetime.now()
+            now = now_oslo()
             events = session.query(Event).filter(
                 Event.parent_id.is_(None) &  # Only non-duplicate events
                 ((Event.start_time > now) |  # Future events
@@ -25,7 +25,7 @@ async def get_active_events() -> List[Dict[str, Any]]:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
 @router.get("/events/{event_id}")
-async def get_event_by_id(event_id: int) -> Dict[str, Any]:
+def get_event_by_id(event_id: int) -> Dict[str, Any]:
     """Get a single event by ID."""
     try:
         with db.session() as session:
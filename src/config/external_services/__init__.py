@@ -9,7 +9,8 @@ from .brightdata import (
 from .openai import (
     OpenAIConfig,
     get_openai_config,
-    init_openai_client
+    init_openai_client,
+    close_openai_client
 )
 
 __all__ = [
@@ -18,5 +19,6 @@ __all__ = [
     'verify_brightdata_auth',
     'OpenAIConfig',
     'get_openai_config',
-    'init_openai_client'
+    'init_openai_client',
+    'close_openai_client'
 ] 
\ No newline at end of file
@@ -1,6 +1,8 @@
 """BrightData service configuration."""
 
+import hmac
 import os
+from functools import lru_cache
 from typing import Dict, Any
 from dataclasses import dataclass
 
@@ -48,7 +50,14 @@ def get_brightdata_config() -> Dict[str, Any]:
     config.validate()
     return config.to_dict()
 
+@lru_cache(maxsize=1)
+def _get_webhook_auth_bytes() -> bytes:
+    """Get the expected webhook authorization header, read from the environment once."""
+    return BrightDataConfig().webhook_auth.encode('utf-8')
+
 def verify_brightdata_auth(auth_header: str) -> bool:
-    """Verify BrightData webhook authorization header."""
-    config = BrightDataConfig()
-    return bool(auth_header and auth_header == config.webhook_auth) 
\ No newline at end of file
+    """Verify BrightData webhook authorization header (constant-time comparison)."""
+    expected = _get_webhook_auth_bytes()
+    if not auth_header or not expected:
+        return False
+    return hmac.compare_digest(auth_header.encode('utf-8'), expected) 
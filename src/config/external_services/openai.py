@@ -1,11 +1,15 @@
 """OpenAI service configuration."""
 
+import logging
 import os
+import threading
 from typing import Dict, Any, Optional
 import httpx
 from openai import OpenAI
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class OpenAIConfig:
     """OpenAI configuration settings."""
@@ -17,10 +21,32 @@ class OpenAIConfig:
     max_tokens: int = 500
     timeout: float = 30.0
     
+    # Retries (with exponential backoff) for rate limits, 5xx errors, timeouts and connection errors
+    max_retries: int = 3
+    
+    # Output budget for the combined classify-and-extract call, which returns the
+    # decision and the full event details (including the description) in one response
+    analysis_max_tokens: int = 1000
+    
+    # Use JSON mode so responses are always a valid JSON object (no markdown fences)
+    json_mode: bool = True
+    
+    # Maximum number of concurrent requests when analyzing a batch of posts
+    max_parallel_requests: int = 16
+    
     def __post_init__(self):
-        """Load API key from environment if not provided."""
+        """Load API key and parallelism from environment if set."""
         if not self.api_key:
             self.api_key = os.environ.get('OPENAI_API_KEY', '')
+        max_parallel = os.environ.get('OPENAI_MAX_PARALLEL')
+        if max_parallel:
+            try:
+                self.max_parallel_requests = max(1, int(max_parallel))
+            except ValueError:
+                logger.warning(
+                    f"Invalid OPENAI_MAX_PARALLEL value '{max_parallel}', "
+                    f"using default of {self.max_parallel_requests}"
+                )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary format."""
@@ -29,7 +55,11 @@ class OpenAIConfig:
             'model': self.model,
             'temperature': self.temperature,
             'max_tokens': self.max_tokens,
-            'timeout': self.timeout
+            'timeout': self.timeout,
+            'max_retries': self.max_retries,
+            'analysis_max_tokens': self.analysis_max_tokens,
+            'json_mode': self.json_mode,
+            'max_parallel_requests': self.max_parallel_requests
         }
     
     def validate(self) -> bool:
@@ -40,6 +70,7 @@ class OpenAIConfig:
 
 # Module-level singleton instance
 _openai: Optional[OpenAI] = None
+_openai_lock = threading.Lock()
 
 def get_openai_config() -> Dict[str, Any]:
     """Get OpenAI configuration with validation."""
@@ -59,16 +90,38 @@ def init_openai_client() -> OpenAI:
     global _openai
     
     if _openai is None:
-        config = OpenAIConfig()
-        config.validate()
-        
-        # Create a custom httpx client without any proxy settings
-        http_client = httpx.Client(
-            base_url="https://api.openai.com/v1",
-            headers={"Authorization": f"Bearer {config.api_key}"},
-            timeout=config.timeout
-        )
-        _openai = OpenAI(api_key=config.api_key, http_client=http_client)
+        # The client is first requested from worker threads, so guard creation
+        with _openai_lock:
+            if _openai is None:
+                config = OpenAIConfig()
+                config.validate()
+                
+                # Create a custom httpx client without any proxy settings, pooling
+                # keep-alive connections across requests. The pool is sized to the
+                # request parallelism so worker threads never queue for a connection
+                http_client = httpx.Client(
+                    base_url="https://api.openai.com/v1",
+                    headers={"Authorization": f"Bearer {config.api_key}"},
+                    timeout=config.timeout,
+                    limits=httpx.Limits(
+                        max_connections=config.max_parallel_requests,
+                        max_keepalive_connections=config.max_parallel_requests
+                    )
+                )
+                _openai = OpenAI(
+                    api_key=config.api_key,
+                    http_client=http_client,
+                    max_retries=config.max_retries
+                )
     
     return _openai
- 
\ No newline at end of file
+ 
+
+def close_openai_client() -> None:
+    """Close the shared OpenAI client and its pooled connections, if it was created."""
+    global _openai
+    
+    with _openai_lock:
+        if _openai is not None:
+            _openai.close()
+            _openai = None
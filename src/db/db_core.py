@@ -4,8 +4,9 @@ This module provides a clean, modern implementation of database management
 with proper configuration, connection pooling, and session handling.
 """
 
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 import logging
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any, Generator
 import os
@@ -150,6 +151,12 @@ class Database:
         self.engine: Optional[Engine] = None
         self._session_factory = sessionmaker()
         self._scoped_session = scoped_session(self._session_factory)
+        
+        # SQLite uses a single shared connection (StaticPool), so sessions from
+        # different threads must not interleave. Reentrant so nested sessions
+        # in the same thread do not deadlock. This is a blocking lock, so sessions
+        # must only be opened from sync code (threadpool), never on the event loop.
+        self._sqlite_lock = threading.RLock() if not IS_PRODUCTION_ENVIRONMENT else None
         self._initialized = True
         
         # Initialize engine on creation
@@ -222,16 +229,17 @@ class Database:
         # Ensure tables exist before providing a session
         self.ensure_tables_exist()
         
-        session = self._scoped_session()
-        try:
-            yield session
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            raise SessionError(f"Database session error: {e}") from e
-        finally:
-            session.close()
-            self._scoped_session.remove()
+        with self._sqlite_lock or nullcontext():
+            session = self._scoped_session()
+            try:
+                yield session
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                raise SessionError(f"Database session error: {e}") from e
+            finally:
+                session.close()
+                self._scoped_session.remove()
 
 # Create the global database instance with default configuration
 db = Database() 
\ No newline at end of file
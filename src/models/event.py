@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from sqlalchemy import Column, Integer, String, Text, DateTime, event, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, event, JSON, ForeignKey, Index
 from sqlalchemy.orm import validates, relationship
 from sqlalchemy import event as sa_event
 import json
@@ -55,7 +55,7 @@ class Event(Base):
     id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False)
     description = Column(Text)
-    start_time = Column(DateTime(timezone=True), nullable=False)
+    start_time = Column(DateTime(timezone=True), nullable=False, index=True)
     
     # Optional fields
     end_time = Column(DateTime(timezone=True))
@@ -76,6 +76,11 @@ class Event(Base):
     # Relationships
     parent = relationship('Event', remote_side=[id], backref='children')
     
+    # Duplicate checks look up events from the same source within a time window
+    __table_args__ = (
+        Index('ix_events_source_name_start_time', 'source_name', 'start_time'),
+    )
+    
     def __init__(self, **kwargs):
         """Initialize an Event with the given attributes."""
         # Handle old attachments field if present
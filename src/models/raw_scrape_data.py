@@ -18,7 +18,7 @@ class ScrapedPost(Base):
         id: Unique identifier (auto-generated)
         post_url: URL of the scraped post
         event_status: Status indicating if the post is about an event
-                     ('contains-event', 'is-event-llm', 'not-event-llm')
+                     ('contains-event', 'is-event-llm', 'not-event-llm', 'not-event-filter')
         scraped_at: When the post was scraped
     """
     __tablename__ = 'scraped_posts'
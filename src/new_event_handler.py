@@ -2,14 +2,15 @@
 
 import logging
 from typing import List, Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from .models.event import Event
 from .db import db, DatabaseError, with_retry
 from .utils.deduplication import (
     merge_events,
     check_duplicate_before_insert,
-    are_events_cross_source_duplicate
+    are_events_cross_source_duplicate,
+    TIME_WINDOW_MINUTES
 )
 from sqlalchemy.orm import Session
 from .config.data_sources import compare_source_priorities, get_source_display_name
@@ -91,9 +92,12 @@ def check_and_process_cross_source_duplicates(new_event: Event, session: Session
     """
     Check for duplicates from other sources and process them.
     """
+    # Duplicates must start within the time window, so only load those candidates
+    time_window = timedelta(minutes=TIME_WINDOW_MINUTES)
     potential_cross_source_duplicates = session.query(Event).filter(
         Event.id != new_event.id,
-        Event.source_name != new_event.source_name
+        Event.source_name != new_event.source_name,
+        Event.start_time.between(new_event.start_time - time_window, new_event.start_time + time_window)
     ).all()
     for existing_event in potential_cross_source_duplicates:
         if are_events_cross_source_duplicate(new_event, existing_event):
@@ -4,7 +4,7 @@ import logging
 from typing import List, Optional, Dict, Any
 import requests
 from datetime import datetime, timedelta
-from sqlalchemy import func
+from sqlalchemy import func, select
 import os
 
 from src.scrapers.base import AsyncScraper
@@ -96,18 +96,18 @@ class FacebookGroupScraper(AsyncScraper):
         """
         try:
             with db.session() as session:
-                # Get all posts within the date range
-                query = session.query(ScrapedPost)
-                query = query.filter(ScrapedPost.scraped_at >= self.start_date)
-                query = query.filter(ScrapedPost.scraped_at <= self.end_date)
+                # Get the URLs of all posts within the date range
+                query = select(ScrapedPost.post_url).where(
+                    ScrapedPost.scraped_at.between(self.start_date, self.end_date)
+                )
                 
-                posts = query.all()
-                logger.info(f"Found {len(posts)} already processed posts")
+                post_urls = session.execute(query).scalars().all()
+                logger.info(f"Found {len(post_urls)} already processed posts")
                 
                 # Extract post IDs from URLs
                 post_ids = []
-                for post in posts:
-                    post_id = self._extract_post_id(post.post_url)
+                for post_url in post_urls:
+                    post_id = self._extract_post_id(post_url)
                     if post_id:
                         post_ids.append(post_id)
                 
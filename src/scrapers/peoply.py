@@ -1,18 +1,31 @@
 """Scraper for peoply.app events"""
 
 from datetime import datetime
-from typing import List
+from typing import List, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-import json
 
 from src.scrapers.base import SyncScraper
 from src.models.event import Event
 from zoneinfo import ZoneInfo
-from src.utils.timezone import now_oslo
+from src.utils.timezone import now_oslo, parse_iso_datetime
 
 logger = logging.getLogger(__name__)
 
+def _create_session() -> requests.Session:
+    """Create a pooled HTTP session with keep-alive and retries for the Peoply API"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.5)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 class PeoplyScraper(SyncScraper):
     """Scraper for peoply.app events"""
     
@@ -24,6 +37,10 @@ class PeoplyScraper(SyncScraper):
         'Accept': 'application/json',
         'Accept-Language': 'en-US,en;q=0.5',
     }
+    REQUEST_TIMEOUT = (5, 30)  # (connect, read) in seconds
+    
+    # Shared across instances so connections are reused between fetches
+    _session = _create_session()
     
     def __init__(self):
         """Initialize the scraper with default settings"""
@@ -35,78 +52,108 @@ class PeoplyScraper(SyncScraper):
     def _get_api_url(self) -> str:
         """Generate the URL for peoply.app events API with the current date"""
         # Convert Oslo time to UTC for the API
-        current_time = now_oslo().astimezone(ZoneInfo("UTC"))
-        time_str = current_time.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
-        encoded_time = time_str.replace(':', '%3A')
+        t = now_oslo().astimezone(ZoneInfo("UTC"))
+        # Millisecond precision ISO timestamp with ':' already URL-encoded
+        encoded_time = (
+            f"{t.year:04d}-{t.month:02d}-{t.day:02d}"
+            f"T{t.hour:02d}%3A{t.minute:02d}%3A{t.second:02d}.{t.microsecond // 1000:03d}Z"
+        )
         return f"{self.base_url}/events?afterDate={encoded_time}&orderBy=startDate&take={self.events_limit}"
     
-    def _fetch_json(self, url: str) -> str:
-        """Fetch JSON content"""
-        response = requests.get(url, headers=self.headers)
+    def _fetch_json(self, url: str) -> List[Dict[str, Any]]:
+        """Fetch and parse JSON content"""
+        response = self._session.get(url, headers=self.headers, timeout=self.REQUEST_TIMEOUT)
         response.raise_for_status()
+        return response.json()
+    
+    def _parse_api_event(self, api_event: Dict[str, Any], source_name: str, fetched_at: datetime) -> Event:
+        """
+        Convert a single Peoply API event into an Event object.
+        
+        Args:
+            api_event: Event dictionary from the Peoply API
+            source_name: Display name of this source, resolved once per fetch
+            fetched_at: Fetch timestamp shared by all events in the fetch
+            
+        Returns:
+            Event: The converted event
+            
+        Raises:
+            KeyError: If a required field is missing from the API event
+        """
+        # Build location with additional details if available
+        location = api_event['locationName']
+        freeform_address = api_event.get('freeformAddress')
+        if freeform_address:
+            location = f"{location}, {freeform_address}"
         
-        # Parse and re-format JSON to make it readable
-        data = response.json()
-        return json.dumps(data, indent=2, ensure_ascii=False)  # ensure_ascii=False preserves unicode characters
+        # Add categories to description
+        description = api_event['description']
+        category_entries = api_event.get('eventCategories')
+        if category_entries:
+            categories = ', '.join(cat['category']['name'] for cat in category_entries)
+            description = f"{description or ''}\n\nCategories: {categories}"
+        
+        # Set the author to the organization name
+        author = None
+        arrangers = api_event.get('eventArrangers')
+        if arrangers:
+            for arranger in arrangers:
+                if arranger.get('role') == 'ADMIN':
+                    arranger_info = arranger['arranger']
+                    organization = arranger_info.get('organization')
+                    user = arranger_info.get('user')
+                    if organization:
+                        author = organization['name']
+                    elif user:
+                        author = f"{user['firstName']} {user['lastName']}"
+                    break
+        
+        # Convert API event to our format
+        end_date = api_event.get('endDate')
+        return Event(
+            title=api_event['title'],
+            description=description,
+            start_time=parse_iso_datetime(api_event['startDate']),
+            end_time=(
+                parse_iso_datetime(end_date)
+                if end_date
+                else None
+            ),
+            location=location,
+            source_url=f"https://peoply.app/events/{api_event['urlId']}",
+            source_name=source_name,
+            fetched_at=fetched_at,
+            author=author
+        )
     
     def get_events(self) -> List[Event]:
         """Get events from peoply.app API"""
+        source_name = self.name()
+        fetched_at = now_oslo()
+        
         try:
             # Fetch events from API
             api_url = self._get_api_url()
-            raw_response = self._fetch_json(api_url)
-            
-            api_events = json.loads(raw_response)
+            api_events = self._fetch_json(api_url)
             logger.info(f"Found {len(api_events)} events from API")
             
             events = []
             for api_event in api_events:
                 try:
-                    # Convert API event to our format
-                    event = Event(
-                        title=api_event['title'],
-                        description=api_event['description'],
-                        start_time=datetime.fromisoformat(api_event['startDate'].replace('Z', '+00:00')),
-                        end_time=(
-                            datetime.fromisoformat(api_event['endDate'].replace('Z', '+00:00'))
-                            if api_event.get('endDate')
-                            else None
-                        ),
-                        location=api_event['locationName'],
-                        source_url=f"https://peoply.app/events/{api_event['urlId']}",
-                        source_name=self.name(),
-                        fetched_at=now_oslo()
-                    )
-                    
-                    # Add additional location details if available
-                    if api_event.get('freeformAddress'):
-                        event.location = f"{api_event['locationName']}, {api_event['freeformAddress']}"
-                    
-                    # Add categories to description
-                    categories = [cat['category']['name'] for cat in api_event.get('eventCategories', [])]
-                    if categories:
-                        event.description = f"{event.description}\n\nCategories: {', '.join(categories)}"
-                    
-                    # Set the author to the organization name
-                    for arranger in api_event.get('eventArrangers', []):
-                        if arranger.get('role') == 'ADMIN':
-                            if arranger['arranger'].get('organization'):
-                                event.author = arranger['arranger']['organization']['name']
-                            elif arranger['arranger'].get('user'):
-                                user = arranger['arranger']['user']
-                                event.author = f"{user['firstName']} {user['lastName']}"
-                            break
-                    
-                    events.append(event)
-                    logger.info(f"Successfully parsed event: {event.title} ({event.start_time} - {event.end_time})")
-                
+                    event = self._parse_api_event(api_event, source_name, fetched_at)
                 except Exception as e:
                     logger.error(f"Error processing event: {e}")
                     continue
+                
+                events.append(event)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Successfully parsed event: {event.title} ({event.start_time} - {event.end_time})")
             
+            logger.info(f"Successfully parsed {len(events)} events")
             return events
 
         except Exception as e:
-            logger.error(f"Error fetching events from {self.name()}: {e}")
+            logger.error(f"Error fetching events from {source_name}: {e}")
             return []
 
@@ -16,6 +16,8 @@ without needing to modify the manager itself.
 import importlib
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Type, Dict, Tuple
 from datetime import datetime
@@ -31,6 +33,9 @@ from src.config.data_sources import get_enabled_sources, ScraperRegistration
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on sources fetched in parallel (fetching is network-bound)
+MAX_CONCURRENT_FETCHES = 16
+
 class SourceManager:
     """
     Central manager for all event scrapers.
@@ -61,19 +66,37 @@ class SourceManager:
             AttributeError: If the class doesn't exist in the module
         """
         try:
-            module_path, class_name = registration.scraper_class.rsplit('.', 1)
-            module = importlib.import_module(module_path)
-            scraper_class = getattr(module, class_name)
-            
-            # Verify the class implements the BaseScraper interface
-            if not issubclass(scraper_class, BaseScraper):
-                raise TypeError(f"Scraper class {class_name} must implement BaseScraper interface")
-                
-            return scraper_class
+            return SourceManager._load_scraper_class(registration.scraper_class)
         except (ImportError, AttributeError) as e:
             logger.error(f"Failed to load scraper class {registration.scraper_class}: {e}")
             raise
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _load_scraper_class(class_path: str) -> Type[BaseScraper]:
+        """
+        Import and validate a scraper class from its dotted path.
+        
+        Results are memoized per class path, so each scraper module is only
+        resolved once per process. Failed imports are not cached.
+        
+        Args:
+            class_path: Full path to the scraper class
+                        Example: 'src.scrapers.peoply.PeoplyScraper'
+        
+        Returns:
+            Type[BaseScraper]: The scraper class (not instance)
+        """
+        module_path, class_name = class_path.rsplit('.', 1)
+        module = importlib.import_module(module_path)
+        scraper_class = getattr(module, class_name)
+        
+        # Verify the class implements the BaseScraper interface
+        if not issubclass(scraper_class, BaseScraper):
+            raise TypeError(f"Scraper class {class_name} must implement BaseScraper interface")
+            
+        return scraper_class
+    
     @staticmethod
     def _get_scraper_type(scraper_class: Type[BaseScraper]) -> str:
         """
@@ -225,4 +248,40 @@ class SourceManager:
                 
         except Exception as e:
             logger.error(f"Error fetching from source {source_id}: {e}")
-            return [] 
\ No newline at end of file
+            return []
+    
+    @staticmethod
+    def fetch_and_parse_all_sources(enabled_sources: Dict[str, ScraperRegistration]) -> Dict[str, List[Event]]:
+        """
+        Fetch events from several sources concurrently.
+        
+        Each source is fetched through fetch_and_parse_single_source in its own
+        worker thread. Scrapers spend most of their time waiting on the network,
+        so total wall time is roughly that of the slowest source.
+        
+        Args:
+            enabled_sources: Dictionary of source IDs and their registrations
+            
+        Returns:
+            Dict[str, List[Event]]: Events per source ID, in the same order as enabled_sources
+        """
+        if not enabled_sources:
+            return {}
+        
+        results: Dict[str, List[Event]] = {}
+        max_workers = min(MAX_CONCURRENT_FETCHES, len(enabled_sources))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(SourceManager.fetch_and_parse_single_source, source_id, registration): source_id
+                for source_id, registration in enabled_sources.items()
+            }
+            for future in as_completed(futures):
+                source_id = futures[future]
+                try:
+                    results[source_id] = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching from source {source_id}: {e}")
+                    results[source_id] = []
+        
+        return {source_id: results[source_id] for source_id in enabled_sources}
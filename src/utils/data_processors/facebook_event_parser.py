@@ -7,94 +7,78 @@ to extract event information and create Event objects.
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 from src.models.event import Event
 from src.scrapers.facebook_event import FacebookEventScraper
+from src.utils.timezone import now_oslo, parse_oslo_datetime
 
 logger = logging.getLogger(__name__)
 
-def _parse_event_date(date_str: str) -> Optional[datetime]:
-    """
-    Parse an event's date string into a datetime object.
-    
-    Args:
-        date_str: Date string to parse (e.g., "2017-11-03T17:00:00.000Z")
-        
-    Returns:
-        datetime object or None if parsing fails
-    """
-    if not date_str:
-        return None
-        
-    try:
-        # Parse ISO format and convert to Oslo timezone
-        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        return dt.astimezone(ZoneInfo("Europe/Oslo"))
-    except ValueError:
-        logger.warning(f"Could not parse date string: {date_str}")
-        return None
-
-def _create_event_from_data(event_data: Dict[str, Any]) -> Optional[Event]:
+def _create_event_from_data(event_data: Dict[str, Any], fetched_at: datetime, source_name: str) -> Optional[Event]:
     """
     Convert Facebook Event data into an Event object.
     
     Args:
         event_data: Raw event data from Facebook
+        fetched_at: When the batch containing this event was fetched
+        source_name: Display name of the source, shared by the whole batch
         
     Returns:
         Optional[Event]: Event object if successful, None otherwise
     """
     try:
+        get = event_data.get
+        
         # Get required fields with better error messages
-        title = event_data.get('title')
+        title = get('title')
         if not title:
             logger.warning("Skipping event: Missing title")
             return None
             
         # Get start time (required)
-        event_date = event_data.get('event_date')
+        event_date = get('event_date')
         if not event_date:
             logger.warning(f"Skipping event '{title}': Missing event_date")
             return None
             
-        start_time = _parse_event_date(event_date)
+        start_time = parse_oslo_datetime(event_date)
         if not start_time:
             logger.warning(f"Skipping event '{title}': Invalid event_date format")
             return None
             
-        # Get description - handle nested structure
-        description = ''
-        desc_data = event_data.get('description')
-        if isinstance(desc_data, dict):
-            description = desc_data.get('text', '')
-        elif isinstance(desc_data, str):
-            description = desc_data
+        # Get description - usually nested as {'text': ...}, sometimes a plain string
+        desc_data = get('description')
+        try:
+            description = desc_data.get('text', '') if desc_data else ''
+        except AttributeError:
+            description = desc_data if isinstance(desc_data, str) else ''
         
         # Get location - handle nested structure safely
-        location = None
-        loc_data = event_data.get('location')
-        if isinstance(loc_data, dict):
-            location = loc_data.get('address')
+        loc_data = get('location')
+        try:
+            location = loc_data.get('address') if loc_data else None
+        except AttributeError:
+            location = None
         
         # Get end time (only if duration is valid)
         end_time = None
-        duration_data = event_data.get('duration')
-        if isinstance(duration_data, dict) and duration_data.get('time_units') and duration_data.get('time'):
+        duration_data = get('duration')
+        if duration_data:
             try:
-                duration_minutes = int(duration_data['time'])
-                if duration_minutes > 0:
-                    end_time = start_time + timedelta(minutes=duration_minutes)
-            except (ValueError, TypeError):
+                if duration_data['time_units']:
+                    duration_minutes = int(duration_data['time'])
+                    if duration_minutes > 0:
+                        end_time = start_time + timedelta(minutes=duration_minutes)
+            except (KeyError, ValueError, TypeError):
                 logger.debug(f"Could not calculate end time for event '{title}': Invalid duration")
         
         # Get URL
-        url = event_data.get('url', '')
+        url = get('url', '')
         
         # Get author (from event_by or hosts) - handle nested structure
         author = None
-        event_by = event_data.get('event_by', [])
-        hosts = event_data.get('hosts', [])
+        event_by = get('event_by', [])
+        hosts = get('hosts', [])
         
         if isinstance(event_by, list) and event_by:
             author = event_by[0].get('name')
@@ -102,11 +86,7 @@ def _create_event_from_data(event_data: Dict[str, Any]) -> Optional[Event]:
             author = hosts[0].get('name')
         
         # Get attachment (main image)
-        attachment = event_data.get('main_image_downloadable')
-        
-        # Get source name from scraper
-        scraper = FacebookEventScraper()
-        source_name = scraper.name()
+        attachment = get('main_image_downloadable')
         
         # Create event
         event = Event(
@@ -117,7 +97,7 @@ def _create_event_from_data(event_data: Dict[str, Any]) -> Optional[Event]:
             location=location,
             source_url=url,
             source_name=source_name,
-            fetched_at=datetime.now(ZoneInfo("Europe/Oslo")),
+            fetched_at=fetched_at,
             author=author,
             attachment=attachment
         )
@@ -148,23 +128,38 @@ def parse_facebook_events(data: Dict[str, Any]) -> List[Event]:
         total_events = len(events_data)
         logger.info(f"Processing {total_events} events from Facebook")
         
+        # All events in the batch share a single fetch timestamp
+        fetched_at = now_oslo()
+        
+        # Get source name from scraper once, rather than constructing a scraper per event
+        source_name = FacebookEventScraper().name()
+        
+        # Only build the per-event debug messages when they will be emitted
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
         # Process each event
         events: List[Event] = []
         for event_data in events_data:
+            title = 'Unknown Title'
             try:
+                title = event_data.get('title', title)
+                
                 # Log event details before processing
-                logger.debug(f"Processing event: {event_data.get('title', 'Unknown Title')}")
-                logger.debug(f"Event data: {event_data}")
+                if debug_enabled:
+                    logger.debug(f"Processing event: {title}")
+                    # Leave out the base64 main image, which can be hundreds of KB
+                    loggable_data = {k: v for k, v in event_data.items() if k != 'main_image_downloadable'}
+                    logger.debug(f"Event data: {loggable_data}")
                 
-                event = _create_event_from_data(event_data)
+                event = _create_event_from_data(event_data, fetched_at, source_name)
                 if event:
                     events.append(event)
-                    logger.debug(f"Successfully created event: {event.title}")
+                    if debug_enabled:
+                        logger.debug(f"Successfully created event: {event.title}")
                 else:
-                    logger.warning(f"Failed to create event from data: {event_data.get('title', 'Unknown Title')}")
+                    logger.warning(f"Failed to create event from data: {title}")
             except Exception as e:
-                logger.error(f"Failed to process event: {e}", exc_info=True)
-                logger.error(f"Event data that caused error: {event_data}")
+                logger.warning(f"Failed to process event '{title}': {e}")
                 continue
         
         logger.info(f"Successfully processed {len(events)} events")
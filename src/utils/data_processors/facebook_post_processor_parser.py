@@ -5,23 +5,32 @@ It uses LLM to determine if a post is an event and extract relevant information.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from zoneinfo import ZoneInfo
 import os
 import json
 import re
 
+from sqlalchemy import insert, select
+
 from src.models.event import Event
 from src.models.raw_scrape_data import ScrapedPost
-from src.utils.llm import is_event_post, parse_event_details
+from src.utils.llm import classify_and_parse_many, looks_like_event
 from src.scrapers.facebook_event import FacebookEventScraper
 from src.scrapers.facebook_post import FacebookGroupScraper
 from src.db import db, DatabaseError, with_retry
 from src.config.data_sources import SOURCES, get_source_display_name
+from src.utils.timezone import ensure_oslo_timezone, now_oslo, parse_oslo_datetime
 
 logger = logging.getLogger(__name__)
 
+# Runs the Facebook Event scrape trigger alongside the LLM analysis
+_event_scrape_executor = ThreadPoolExecutor(max_workers=1)
+
+# Matches Facebook Event links in post content
+_FB_EVENT_URL_RE = re.compile(r'https://www\.facebook\.com/events/\d+/')
+
 @with_retry()
 def _store_scraped_posts(posts: List[Dict[str, Any]]) -> List[int]:
     """
@@ -31,8 +40,8 @@ def _store_scraped_posts(posts: List[Dict[str, Any]]) -> List[int]:
         posts: List of dictionaries containing:
             - post_url: URL of the scraped post
             - event_status: Status indicating if the post is about an event
-                          ('contains-event', 'is-event-llm', 'not-event-llm')
-            - scraped_at: When the post was scraped
+                          ('contains-event', 'is-event-llm', 'not-event-llm', 'not-event-filter')
+            - scraped_at: When the post was scraped (optional, defaults to now)
             
     Returns:
         List[int]: List of IDs of stored entries
@@ -41,51 +50,48 @@ def _store_scraped_posts(posts: List[Dict[str, Any]]) -> List[int]:
         DatabaseError: If there is an error storing the data
     """
     
+    if not posts:
+        return []
+    
+    # All posts without an explicit timestamp share one default
+    default_scraped_at = now_oslo()
+    
+    # Build plain rows so all posts go out in a single multi-row INSERT
+    rows = [
+        {
+            'post_url': post['post_url'],
+            'event_status': post['event_status'],
+            'scraped_at': ensure_oslo_timezone(post.get('scraped_at')) or default_scraped_at
+        }
+        for post in posts
+    ]
+    
     try:
         with db.session() as session:
-            for post in posts:
-                post_entry = ScrapedPost(
-                    post_url=post['post_url'],
-                    event_status=post['event_status'],
-                    scraped_at=post['scraped_at']
-                )
-                session.add(post_entry)
+            result = session.execute(
+                insert(ScrapedPost).returning(ScrapedPost.id),
+                rows
+            )
+            return list(result.scalars())
         
     except Exception as e:
         logger.error(f"Failed to store raw data batch: {str(e)}")
         raise DatabaseError(f"Failed to store raw data batch: {str(e)}") from e
 
-def _parse_post_date(date_str: str) -> Optional[datetime]:
-    """
-    Parse a post's date string into a datetime object.
-    
-    Handles multiple date formats and returns None if parsing fails.
-    
-    Args:
-        date_str: Date string to parse
-        
-    Returns:
-        datetime object or None if parsing fails
-    """
-    if not date_str:
-        return None
-        
-    try:
-        # Try ISO format (2024-03-19T14:30:00)
-        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        return dt.astimezone(ZoneInfo("Europe/Oslo"))
-    except ValueError:
-        # Log the error but don't raise an exception
-        logger.warning(f"Could not parse date string: {date_str}")
-        return None
-
-def _create_event_from_post(post: Dict[str, Any], event_details: Dict[str, Any]) -> Event:
+def _create_event_from_post(
+    post: Dict[str, Any],
+    event_details: Dict[str, Any],
+    fetched_at: datetime,
+    source_name: str
+) -> Event:
     """
     Convert a Facebook post into an Event object using LLM-parsed details.
     
     Args:
         post: Raw post data from Facebook
         event_details: Structured event details parsed by LLM
+        fetched_at: When the batch containing this post was processed
+        source_name: Display name of the source, shared by the whole batch
         
     Returns:
         Event object
@@ -94,77 +100,47 @@ def _create_event_from_post(post: Dict[str, Any], event_details: Dict[str, Any])
         ValueError: If required event data is missing
     """
     try:
+        get_detail = event_details.get
+        
         # Get title (required field)
-        title = event_details.get('title') or post.get('post_external_title')
+        title = get_detail('title') or post.get('post_external_title')
         if not title:
             raise ValueError("Cannot create event without a title")
-            
-        # Get description (optional)
-        description = event_details.get('description') or post.get('content', '')
         
         # Get start time (required field)
         start_time = None
-        if event_details.get('start_time'):
-            start_time = _parse_post_date(event_details['start_time'])
+        start_time_str = get_detail('start_time')
+        if start_time_str:
+            start_time = parse_oslo_datetime(start_time_str)
         if not start_time and post.get('date_posted'):
-            start_time = _parse_post_date(post['date_posted'])
+            start_time = parse_oslo_datetime(post['date_posted'])
         if not start_time:
             # If no start time can be parsed, use current time as fallback
             logger.warning(f"No valid start time found for event: {title}, using current time")
-            start_time = datetime.now(ZoneInfo("Europe/Oslo"))
+            start_time = now_oslo()
         
         # Get end time (optional)
-        end_time = None
-        if event_details.get('end_time'):
-            end_time = _parse_post_date(event_details['end_time'])
-            
-        # Get location (optional)
-        location = event_details.get('location')
-        
-        # Get URL (optional)
-        post_url = post.get('url', '')
+        end_time_str = get_detail('end_time')
+        end_time = parse_oslo_datetime(end_time_str) if end_time_str else None
         
-        # Get source name from configuration using standard method
-        source_name = get_source_display_name('facebook-post')
-        
-        # Create event
-        event = Event(
+        # Create event in a single constructor call; description falls back to
+        # the post content, author is the post author if available
+        return Event(
             title=title,
-            description=description,
+            description=get_detail('description') or post.get('content', ''),
             start_time=start_time,
             end_time=end_time,
-            location=location,
-            source_url=post_url,
+            location=get_detail('location'),
+            source_url=post.get('url', ''),
             source_name=source_name,
-            fetched_at=datetime.now(ZoneInfo("Europe/Oslo"))
+            fetched_at=fetched_at,
+            author=post.get('user_username_raw') or None
         )
         
-        # Add author if available
-        if post.get('user_username_raw'):
-            event.author = post['user_username_raw']
-        
-        return event
-        
     except Exception as e:
         logger.error(f"Error creating event from post: {str(e)}", exc_info=True)
         raise ValueError(f"Failed to create event from post: {str(e)}")
 
-def _has_facebook_event(post: Dict[str, Any]) -> bool:
-    """
-    Check if a post contains a Facebook Event link.
-    
-    A post can contain an Event link in two ways:
-    1. As an attachment of type 'ProfilePicAttachmentMedia' with an Event URL
-    2. As a direct link in the post content
-    
-    Args:
-        post: Raw post data from Facebook
-        
-    Returns:
-        bool: True if the post contains a Facebook Event link
-    """
-    return len(_extract_facebook_event_links(post)) > 0
-
 def _extract_facebook_event_links(post: Dict[str, Any]) -> List[str]:
     """
     Extract all Facebook Event links from a post.
@@ -193,11 +169,36 @@ def _extract_facebook_event_links(post: Dict[str, Any]) -> List[str]:
     # Check post content for Event links
     content = post.get('content', '')
     # Look for URLs that match the Facebook Event pattern
-    event_urls = re.findall(r'https://www\.facebook\.com/events/\d+/', content)
+    event_urls = _FB_EVENT_URL_RE.findall(content)
     event_links.extend(event_urls)
     
-    # Remove duplicates while preserving order
-    return list(dict.fromkeys(event_links))
+    # Duplicates are removed once for the whole batch by the caller
+    return event_links
+
+def _trigger_event_scrape(event_urls: List[str]) -> bool:
+    """
+    Trigger a BrightData scrape of the given Facebook Event URLs.
+    
+    Args:
+        event_urls: Unique Facebook Event URLs to scrape
+        
+    Returns:
+        bool: True if the scrape was triggered successfully
+    """
+    try:
+        return FacebookEventScraper().initialize_data_fetch(event_urls)
+    except Exception as e:
+        logger.error(f"Error triggering Facebook Event scraping: {e}")
+        return False
+
+def _build_llm_content(post: Dict[str, Any]) -> str:
+    """Build the text sent to the LLM for a post (external title followed by content)."""
+    return f"{post.get('post_external_title', '')}\n\n{post.get('content', '')}"
+
+def _analysis_key(candidate: Tuple[Dict[str, Any], str]) -> Tuple[Optional[str], ...]:
+    """Build a key from the inputs that determine the LLM analysis of a post."""
+    post, content = candidate
+    return (content, post.get('date_posted'), post.get('user_username_raw'))
 
 def process_facebook_post_scrape_data(data: Dict[str, Any]) -> List[Event]:
     """
@@ -223,7 +224,7 @@ def process_facebook_post_scrape_data(data: Dict[str, Any]) -> List[Event]:
     """
     try:
         # Store the timestamp when processing starts
-        processing_start_time = datetime.now(ZoneInfo("Europe/Oslo"))
+        processing_start_time = now_oslo()
         
         posts = data.get('posts', [])
         if not posts:
@@ -233,95 +234,151 @@ def process_facebook_post_scrape_data(data: Dict[str, Any]) -> List[Event]:
         total_posts = len(posts)
         logger.info(f"Processing {total_posts} posts from Facebook")
         
-        # Get all existing post URLs from database
-        with db.session() as session:
-            existing_urls = {post.post_url for post in session.query(ScrapedPost).all()}
-        
-        # Filter out posts that have already been processed
-        posts_to_process = []
-        skipped_posts = []
+        # Get the incoming post URLs that already exist in the database
+        incoming_urls = list({post.get('url') for post in posts if post.get('url')})
+        existing_urls = set()
+        if incoming_urls:
+            with db.session() as session:
+                existing_urls = set(session.execute(
+                    select(ScrapedPost.post_url).where(ScrapedPost.post_url.in_(incoming_urls))
+                ).scalars())
+        
+        # Single pass: skip posts that have already been processed, and split the rest
+        # based on whether they contain Facebook Event links, collecting the links
+        # while scanning so each post is only scanned once
+        skipped_count = 0
+        posts_with_event_links = []
+        posts_without_event_links = []
+        event_urls = []
         
         for post in posts:
-            post_url = post.get('url', '')
-            if post_url in existing_urls:
-                skipped_posts.append(post)
+            if post.get('url', '') in existing_urls:
+                skipped_count += 1
+                continue
+            
+            links = _extract_facebook_event_links(post)
+            if links:
+                posts_with_event_links.append(post)
+                event_urls.extend(links)
             else:
-                posts_to_process.append(post)
+                posts_without_event_links.append(post)
         
-        if skipped_posts:
-            logger.info(f"Skipping {len(skipped_posts)} already processed posts")
+        if skipped_count:
+            logger.info(f"Skipping {skipped_count} already processed posts")
         
-        if not posts_to_process:
+        new_post_count = total_posts - skipped_count
+        if not new_post_count:
             logger.info("No new posts to process")
             return []
         
-        logger.info(f"Processing {len(posts_to_process)} new posts")
+        logger.info(f"Processing {new_post_count} new posts")
         
-        # Split posts into two lists based on whether they contain Facebook Event links
-        posts_with_event_links = []
-        posts_without_event_links = []
+        logger.info(f"Found {len(posts_with_event_links)} posts with Facebook Event links")
         
-        for post in posts_to_process:
-            if _has_facebook_event(post):
-                posts_with_event_links.append(post)
-            else:
-                posts_without_event_links.append(post)
+        # Remove duplicates (the scraper does not depend on the order of the URLs)
+        event_urls_unique = list(set(event_urls))
+        logger.info(f"Removed {len(event_urls) - len(event_urls_unique)} duplicate Facebook Event URLs")
+
+        if event_urls:
+            logger.info(f"Found {len(event_urls_unique)} unique Facebook Event URLs")
         
-        logger.info(f"Found {len(posts_with_event_links)} posts with Facebook Event links")
+        # Trigger event scraping if we found any event URLs. The trigger is an
+        # independent HTTP request, so it runs in the background during the LLM analysis
+        event_scrape_trigger = None
+        if event_urls_unique:
+            logger.info(f"Triggering scrape for {len(event_urls_unique)} unique Facebook Event links")
+            event_scrape_trigger = _event_scrape_executor.submit(_trigger_event_scrape, event_urls_unique)
         
         # Process posts without Event links using LLM
         logger.info(f"Analyzing {len(posts_without_event_links)} posts with LLM")
 
         events: List[Event] = []
-        posts_without_event_links_to_store = []
+        scraped_posts_to_store = []
         
-        for i, post in enumerate(posts_without_event_links):
-            try:
-                # Skip posts without content
-                if not post.get('content'):
-                    continue
-                
-                content = f"{post.get('post_external_title', '')}\n\n{post.get('content', '')}"
-                is_event, _ = is_event_post(
-                    content=content,
-                    post_date=post.get('date_posted'),
-                    author=post.get('user_username_raw')
-                )
-                
-                # Add post to storage list with its event status
+        # Skip posts without content, and keep clear non-events away from the LLM
+        llm_candidates = []
+        for post in posts_without_event_links:
+            if not post.get('content'):
+                continue
+            content = _build_llm_content(post)
+            if looks_like_event(content):
+                llm_candidates.append((post, content))
+            else:
                 post_url = post.get('url', '')
                 if post_url:
-                    event_status = 'is-event-llm' if is_event else 'not-event-llm'
-                    posts_without_event_links_to_store.append({
+                    scraped_posts_to_store.append({
                         'post_url': post_url,
-                        'event_status': event_status,
+                        'event_status': 'not-event-filter',
                         'scraped_at': processing_start_time
                     })
-                
-                if is_event:
-                    event_details = parse_event_details(
-                        content=content,
-                        url=post_url,
-                        post_date=post.get('date_posted'),
-                        author=post.get('user_username_raw')
-                    )
+        
+        prefiltered_count = len(scraped_posts_to_store)
+        if prefiltered_count:
+            logger.info(f"Skipped LLM analysis for {prefiltered_count} short posts without event hints")
+        
+        if llm_candidates:
+            # Identical posts (reposts, retried deliveries) only need to be analyzed once
+            candidate_keys = [_analysis_key(candidate) for candidate in llm_candidates]
+            unique_indices: Dict[Tuple[Optional[str], ...], int] = {}
+            unique_candidates = []
+            for key, candidate in zip(candidate_keys, llm_candidates):
+                if key not in unique_indices:
+                    unique_indices[key] = len(unique_candidates)
+                    unique_candidates.append(candidate)
+            
+            if len(unique_candidates) < len(llm_candidates):
+                logger.info(f"Analyzing {len(unique_candidates)} unique posts out of {len(llm_candidates)}")
+            
+            # Analyze the unique posts concurrently
+            unique_analyses = classify_and_parse_many([
+                {
+                    'content': content,
+                    'url': post.get('url', ''),
+                    'post_date': post.get('date_posted'),
+                    'author': post.get('user_username_raw')
+                }
+                for post, content in unique_candidates
+            ])
+            analyses = [unique_analyses[unique_indices[key]] for key in candidate_keys]
+            
+            # Look up the source name once for all events created from this batch
+            source_name = get_source_display_name('facebook-post')
+            
+            failed_count = 0
+            for i, ((post, _), analysis) in enumerate(zip(llm_candidates, analyses)):
+                try:
+                    # Leave posts without an LLM answer unstored, so they are analyzed again next delivery
+                    if analysis is None:
+                        failed_count += 1
+                        continue
+                    is_event, event_details = analysis
+                    
+                    # Add post to storage list with its event status
+                    post_url = post.get('url', '')
+                    if post_url:
+                        event_status = 'is-event-llm' if is_event else 'not-event-llm'
+                        scraped_posts_to_store.append({
+                            'post_url': post_url,
+                            'event_status': event_status,
+                            'scraped_at': processing_start_time
+                        })
+                    
                     if event_details:
                         try:
-                            event = _create_event_from_post(post, event_details)
+                            event = _create_event_from_post(post, event_details, processing_start_time, source_name)
                             if event:
                                 events.append(event)
                         except ValueError as e:
                             logger.warning(f"Could not create event: {e}")
+                            
+                    logger.debug(f"--- Analyzed post {i+1} of {len(llm_candidates)}")
                         
-                logger.info(f"--- Analyzed post {i+1} of {len(posts_without_event_links)}")
-                    
-            except Exception as e:
-                logger.error(f"Failed to process post: {e}")
-                continue
-        
-        # Store posts processed by LLM
-        if posts_without_event_links_to_store:
-            _store_scraped_posts(posts_without_event_links_to_store)
+                except Exception as e:
+                    logger.error(f"Failed to process post: {e}")
+                    continue
+            
+            if failed_count:
+                logger.warning(f"LLM analysis failed for {failed_count} posts; they will be retried on a later delivery")
         
         logger.info(f"Successfully identified {len(events)} events from {len(posts_without_event_links)} posts without direct event-links")
         
@@ -330,39 +387,22 @@ def process_facebook_post_scrape_data(data: Dict[str, Any]) -> List[Event]:
 
 
         # Handle posts with event links
-
-        # Store posts with event links
-        posts_with_event_links_to_store = []
         for post in posts_with_event_links:
             post_url = post.get('url', '')
             if post_url:
-                posts_with_event_links_to_store.append({
+                scraped_posts_to_store.append({
                     'post_url': post_url,
                     'event_status': 'contains-event',
                     'scraped_at': processing_start_time
                 })
         
-        if posts_with_event_links_to_store:
-            _store_scraped_posts(posts_with_event_links_to_store)
-        
-        # Extract event URLs from posts with events
-        event_urls = []
-        for post in posts_with_event_links:
-            event_urls.extend(_extract_facebook_event_links(post))
+        # Store all processed posts in a single transaction
+        if scraped_posts_to_store:
+            _store_scraped_posts(scraped_posts_to_store)
         
-        # Remove duplicates while preserving order
-        event_urls_unique = list(dict.fromkeys(event_urls))
-        logger.info(f"Removed {len(event_urls) - len(event_urls_unique)} duplicate Facebook Event URLs")
-
-        if event_urls:
-            logger.info(f"Found {len(event_urls_unique)} unique Facebook Event URLs")
-            
-        # Trigger event scraping if we found any event URLs
-        if event_urls_unique:
-            logger.info(f"Triggering scrape for {len(event_urls_unique)} unique Facebook Event links")
-            scraper = FacebookEventScraper()
-            if not scraper.initialize_data_fetch(event_urls_unique):
-                logger.error("Failed to trigger Facebook Event scraping")
+        # Wait for the Facebook Event scrape trigger started before the LLM analysis
+        if event_scrape_trigger is not None and not event_scrape_trigger.result():
+            logger.error("Failed to trigger Facebook Event scraping")
         
         return events
         
@@ -2,6 +2,7 @@ from datetime import datetime, timedelta
 import logging
 from typing import Optional, List, Tuple, Any, Dict, Callable
 from difflib import SequenceMatcher
+from functools import lru_cache
 from ..models.event import Event
 from ..db import db, DatabaseError, with_retry
 from sqlalchemy.orm import Session
@@ -48,8 +49,9 @@ EVENT_MERGE_STRATEGIES: Dict[str, Callable[[Event, Event], Any]] = {
     )
 }
 
+@lru_cache(maxsize=4096)
 def _normalize_string(text: str) -> str:
-    """Normalize string based on configuration constants"""
+    """Normalize string based on configuration constants (cached, as titles are compared repeatedly)"""
     if not text:
         return ""
     if IGNORE_CASE:
@@ -58,15 +60,31 @@ def _normalize_string(text: str) -> str:
         text = ' '.join(text.split())
     return text
 
-def _calculate_title_similarity(title1: str, title2: str) -> float:
+def _are_titles_similar(title1: str, title2: str) -> bool:
     """
-    Calculate similarity between two titles.
-    Currently uses a simple ratio, but could be enhanced with better algorithms.
+    Check whether two titles reach TITLE_SIMILARITY_THRESHOLD.
+    
+    Compares normalized titles with SequenceMatcher's ratio, but rejects clearly
+    different titles through cheap upper bounds before computing the full ratio:
+    the length difference, then real_quick_ratio and quick_ratio.
     """
     title1 = _normalize_string(title1)
     title2 = _normalize_string(title2)
     
-    return SequenceMatcher(None, title1, title2).ratio()
+    if title1 == title2:
+        return True
+    
+    # The ratio is 2*matches/(len1+len2), so it can never exceed 2*min/(len1+len2)
+    len1, len2 = len(title1), len(title2)
+    if 2 * min(len1, len2) < TITLE_SIMILARITY_THRESHOLD * (len1 + len2):
+        return False
+    
+    matcher = SequenceMatcher(None, title1, title2)
+    return (
+        matcher.real_quick_ratio() >= TITLE_SIMILARITY_THRESHOLD
+        and matcher.quick_ratio() >= TITLE_SIMILARITY_THRESHOLD
+        and matcher.ratio() >= TITLE_SIMILARITY_THRESHOLD
+    )
 
 def _are_events_duplicate(event1: Event, event2: Event) -> bool:
     """
@@ -79,11 +97,6 @@ def _are_events_duplicate(event1: Event, event2: Event) -> bool:
             if not event1.source_name or not event2.source_name or event1.source_name != event2.source_name:
                 return False
         
-        # Check title similarity
-        title_similarity = _calculate_title_similarity(event1.title, event2.title)
-        if title_similarity < TITLE_SIMILARITY_THRESHOLD:
-            return False
-        
         # Check times
         if REQUIRE_EXACT_TIME:
             if event1.start_time != event2.start_time:
@@ -104,6 +117,10 @@ def _are_events_duplicate(event1: Event, event2: Event) -> bool:
             if loc1 != loc2:
                 return False
         
+        # Check title similarity last, as it is the most expensive check
+        if not _are_titles_similar(event1.title, event2.title):
+            return False
+        
         return True
     except Exception as e:
         logger.error(f"Error in _are_events_duplicate: {e}", exc_info=True)
@@ -223,11 +240,6 @@ def _are_events_cross_source_duplicate(event1: Event, event2: Event) -> bool:
     Returns True if events are considered duplicates, False otherwise.
     """
     try:
-        # Check title similarity
-        title_similarity = _calculate_title_similarity(event1.title, event2.title)
-        if title_similarity < TITLE_SIMILARITY_THRESHOLD:
-            return False
-        
         # Check times
         if REQUIRE_EXACT_TIME:
             if event1.start_time != event2.start_time:
@@ -248,6 +260,10 @@ def _are_events_cross_source_duplicate(event1: Event, event2: Event) -> bool:
             if loc1 != loc2:
                 return False
         
+        # Check title similarity last, as it is the most expensive check
+        if not _are_titles_similar(event1.title, event2.title):
+            return False
+        
         return True
     except Exception as e:
         logger.error(f"Error in _are_events_cross_source_duplicate: {e}", exc_info=True)
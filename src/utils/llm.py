@@ -4,9 +4,15 @@ This module provides functions for interacting with OpenAI's LLM models,
 specifically for event detection and information extraction.
 """
 
+import hashlib
 import json
 import logging
-from typing import Dict, Any, Optional, Tuple
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -14,30 +20,174 @@ from src.config.external_services.openai import OpenAIConfig, init_openai_client
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of classify_and_parse results kept in memory. Webhook retries and
+# replays re-deliver identical posts, so repeat analyses are served from here.
+ANALYSIS_CACHE_SIZE = 2048
+
+# Posts shorter than this (in characters) are only sent to the LLM if they contain an event hint
+PREFILTER_MAX_LENGTH = 280
+
+# Cheap signals that a post might be about an event. The filter should only reject posts
+# that are clearly not events, so hints are broad:
+# - event word stems, matched anywhere so compounds like "julebord", "halloweenfest",
+#   "kahoot-kveld" and "fredagspils" also count
+# - whole words for times, places, sign-up and food
+# - weekdays, month names, dates and clock times
+_EVENT_HINT_RE = re.compile(
+    r'(?:event|arrangement|workshop|seminar|kurs|foredrag|meetup|møte|fest|party|quiz|bedpres|'
+    r'kveld|bord|pils|konsert|lunsj|middag|frokost|dugnad|turnering|kahoot|'
+    r'(?:man|tirs|ons|tors|fre|lør|søn)dag|(?:mon|tues|wednes|thurs|fri|satur|sun)day)'
+    r'|\b(?:påmelding|meld deg|registration|sign up|pizza|mat|food|kl|dato|date|when|where|når|hvor|'
+    r'tid|sted|i dag|idag|i morgen|imorgen|today|tomorrow|tonight|helg|helgen|weekend|'
+    r'neste uke|next week|bli med|join us|velkommen|welcome|'
+    r'januar|februar|mars|april|mai|juni|juli|august|september|oktober|november|desember|'
+    r'january|february|march|may|june|july|october|december)\b'
+    r'|\d{1,2}[./:]\d{1,2}'
+    r'|\d{1,2}\.?\s*(?:jan|feb|mar|apr|mai|may|jun|jul|aug|sep|okt|oct|nov|des|dec)',
+    re.IGNORECASE
+)
+
+# Matches a markdown code block (optionally tagged as json) around a JSON response
+_JSON_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+
+# System prompt for is_event_post. System prompts are fixed strings sent first,
+# so the shared request prefix can be served from OpenAI's prompt cache.
+SYSTEM_CLASSIFY = (
+    "You are a helpful assistant that determines if a post is about an event. "
+    "The input will include the post's date and author. "
+    "Consider these factors when determining if something is an event:\n"
+    "1. The temporal context (when the post was made vs when the event is/was)\n"
+    "2. The author's role (official sources are more likely to post events)\n"
+    "3. The content structure and language used\n"
+    "Always respond with a valid JSON object."
+)
+
+# System prompt for parse_event_details
+SYSTEM_EXTRACT = (
+    "You are a helpful assistant that extracts event details from social media posts. "
+    "The input will include the post's date and author. "
+    "When interpreting dates in the post content:\n"
+    "1. If the post mentions 'today', 'i dag', 'tomorrow', 'imorgen', etc., use the post's date as reference\n"
+    "2. If a date is mentioned without a year, use the year from the post date\n"
+    "3. For explicit dates with years, use those exactly as specified\n"
+    "4. Consider the temporal context (when the post was made) when interpreting relative dates\n"
+    "5. If the post is about a past event, ensure the dates are in the past relative to the post date\n"
+    "6. If the post is about a future event, ensure the dates are in the future relative to the post date\n"
+    "Always respond with a valid JSON object."
+)
+
+# System prompt for classify_and_parse (classification and extraction in one call)
+SYSTEM_CLASSIFY_AND_EXTRACT = (
+    "You are a helpful assistant that determines if a social media post is about an event "
+    "and, if it is, extracts the event details. "
+    "The input will include the post's date and author. "
+    "Consider these factors when determining if something is an event:\n"
+    "1. The temporal context (when the post was made vs when the event is/was)\n"
+    "2. The author's role (official sources are more likely to post events)\n"
+    "3. The content structure and language used\n"
+    "When interpreting dates in the post content:\n"
+    "1. If the post mentions 'today', 'i dag', 'tomorrow', 'imorgen', etc., use the post's date as reference\n"
+    "2. If a date is mentioned without a year, use the year from the post date\n"
+    "3. For explicit dates with years, use those exactly as specified\n"
+    "4. Consider the temporal context (when the post was made) when interpreting relative dates\n"
+    "5. If the post is about a past event, ensure the dates are in the past relative to the post date\n"
+    "6. If the post is about a future event, ensure the dates are in the future relative to the post date\n"
+    "Always respond with a valid JSON object."
+)
+
+_analysis_cache: "OrderedDict[str, Tuple[bool, Optional[Dict[str, Any]]]]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _get_default_config() -> Dict[str, Any]:
+    """Get the default LLM configuration, built once from the environment (treat as read-only)."""
+    return OpenAIConfig().to_dict()
+
+def _get_response_format_kwargs(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Request JSON mode when enabled in the config, so responses are always a bare JSON object."""
+    return {'response_format': {"type": "json_object"}} if config.get('json_mode') else {}
+
+def _get_analysis_max_tokens(config: Dict[str, Any]) -> int:
+    """Get the output budget for classify_and_parse (falls back to max_tokens for custom configs)."""
+    return config.get('analysis_max_tokens', config['max_tokens'])
+
+def looks_like_event(content: str) -> bool:
+    """
+    Cheap local check for whether a post could be about an event.
+    
+    Long posts are always considered candidates. Short posts are only
+    considered candidates if they contain an event keyword, weekday, date or time.
+    
+    Args:
+        content: The text content to check
+    
+    Returns:
+        bool: False if the post is clearly not an event, True if it should be analyzed
+    """
+    if len(content) >= PREFILTER_MAX_LENGTH:
+        return True
+    return _EVENT_HINT_RE.search(content) is not None
+
+def _analysis_cache_key(
+    content: str,
+    post_date: Optional[str],
+    author: Optional[str],
+    config: Dict[str, Any]
+) -> str:
+    """Build a cache key from the model settings and inputs that influence the LLM analysis."""
+    raw = "\x00".join((
+        str(config['model']),
+        str(config['temperature']),
+        str(_get_analysis_max_tokens(config)),
+        str(bool(config.get('json_mode'))),
+        post_date or '',
+        author or '',
+        content.strip()
+    ))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+def _get_cached_analysis(key: str) -> Optional[Tuple[bool, Optional[Dict[str, Any]]]]:
+    """Return a cached analysis result and mark it as recently used."""
+    with _analysis_cache_lock:
+        result = _analysis_cache.get(key)
+        if result is not None:
+            _analysis_cache.move_to_end(key)
+        return result
+
+def _cache_analysis(key: str, result: Tuple[bool, Optional[Dict[str, Any]]]) -> None:
+    """Store an analysis result, evicting the least recently used entry when full."""
+    with _analysis_cache_lock:
+        _analysis_cache[key] = result
+        _analysis_cache.move_to_end(key)
+        if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+
 def _extract_json_from_response(response_text: str) -> Optional[Dict[str, Any]]:
     """Extract JSON from a response that might be wrapped in markdown code blocks."""
-    # First try parsing as-is
-    try:
-        return json.loads(response_text)
-    except json.JSONDecodeError:
-        pass
+    # Parse as-is unless the response is clearly fenced (avoids a failing parse)
+    if not response_text.startswith("```"):
+        try:
+            return json.loads(response_text)
+        except json.JSONDecodeError:
+            pass
     
     # Try extracting from markdown code block
-    if "```" in response_text:
+    match = _JSON_CODE_BLOCK_RE.search(response_text)
+    if match:
         try:
-            # Find content between code blocks
-            start = response_text.find("```") + 3
-            end = response_text.rfind("```")
-            # Skip language identifier if present
-            if "json" in response_text[start:start+10]:
-                start = response_text.find("\n", start) + 1
-            json_str = response_text[start:end].strip()
-            return json.loads(json_str)
-        except (json.JSONDecodeError, ValueError):
+            return json.loads(match.group(1))
+        except json.JSONDecodeError:
             pass
     
     return None
 
+def _format_post_with_metadata(content: str, post_date: Optional[str], author: Optional[str]) -> str:
+    """Prefix post content with its posting date and author for the LLM prompt."""
+    return f"""Posted on: {post_date if post_date else 'Unknown date'}
+Posted by: {author if author else 'Unknown author'}
+
+{content}"""
+
 def is_event_post(
     content: str,
     post_date: Optional[str] = None,
@@ -57,32 +207,19 @@ def is_event_post(
         Tuple of (is_event: bool, explanation: str)
     """
     try:
-        config = config or OpenAIConfig().to_dict()
+        config = config or _get_default_config()
         openai = init_openai_client()
         
         # Prepare content with metadata
-        content_with_metadata = f"""Posted on: {post_date if post_date else 'Unknown date'}
-Posted by: {author if author else 'Unknown author'}
-
-{content}"""
+        content_with_metadata = _format_post_with_metadata(content, post_date, author)
         
         response = openai.chat.completions.create(
             model=config['model'],
             temperature=config['temperature'],
             max_tokens=config['max_tokens'],
+            **_get_response_format_kwargs(config),
             messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a helpful assistant that determines if a post is about an event. "
-                        "The input will include the post's date and author. "
-                        "Consider these factors when determining if something is an event:\n"
-                        "1. The temporal context (when the post was made vs when the event is/was)\n"
-                        "2. The author's role (official sources are more likely to post events)\n"
-                        "3. The content structure and language used\n"
-                        "Always respond with a valid JSON object."
-                    )
-                },
+                {"role": "system", "content": SYSTEM_CLASSIFY},
                 {
                     "role": "user",
                     "content": f"Is this post about an event? Please respond with a JSON object containing 'is_event' (boolean) and 'explanation' (string). Post content:\n\n{content_with_metadata}"
@@ -124,35 +261,19 @@ def parse_event_details(
         Dictionary with event details or None if parsing fails
     """
     try:
-        config = config or OpenAIConfig().to_dict()
+        config = config or _get_default_config()
         openai = init_openai_client()
         
         # Prepare content with metadata
-        content_with_metadata = f"""Posted on: {post_date if post_date else 'Unknown date'}
-Posted by: {author if author else 'Unknown author'}
-
-{content}"""
+        content_with_metadata = _format_post_with_metadata(content, post_date, author)
         
         response = openai.chat.completions.create(
             model=config['model'],
             temperature=config['temperature'],
             max_tokens=config['max_tokens'],
+            **_get_response_format_kwargs(config),
             messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a helpful assistant that extracts event details from social media posts. "
-                        "The input will include the post's date and author. "
-                        "When interpreting dates in the post content:\n"
-                        "1. If the post mentions 'today', 'i dag', 'tomorrow', 'imorgen', etc., use the post's date as reference\n"
-                        "2. If a date is mentioned without a year, use the year from the post date\n"
-                        "3. For explicit dates with years, use those exactly as specified\n"
-                        "4. Consider the temporal context (when the post was made) when interpreting relative dates\n"
-                        "5. If the post is about a past event, ensure the dates are in the past relative to the post date\n"
-                        "6. If the post is about a future event, ensure the dates are in the future relative to the post date\n"
-                        "Always respond with a valid JSON object."
-                    )
-                },
+                {"role": "system", "content": SYSTEM_EXTRACT},
                 {
                     "role": "user",
                     "content": (
@@ -182,4 +303,129 @@ Posted by: {author if author else 'Unknown author'}
         
     except Exception as e:
         logger.error(f"Error in parse_event_details: {e}")
-        return None 
\ No newline at end of file
+        return None
+
+def classify_and_parse(
+    content: str,
+    url: str,
+    post_date: Optional[str] = None,
+    author: Optional[str] = None,
+    config: Optional[Dict[str, Any]] = None
+) -> Optional[Tuple[bool, Optional[Dict[str, Any]]]]:
+    """
+    Use OpenAI to determine if a post is about an event and, if so, parse its details.
+    
+    This combines is_event_post and parse_event_details into a single request,
+    saving one round-trip (and the duplicated prompt tokens) for every event post.
+    Successful results are cached in memory, keyed on a hash of the model
+    settings, content, post date and author.
+    
+    Args:
+        content: The text content to analyze
+        url: The URL of the post
+        post_date: The original posting date of the content
+        author: The author of the post
+        config: Optional LLM configuration. If not provided, uses default config
+    
+    Returns:
+        Tuple of (is_event: bool, event_details: dict or None), where event_details
+        is None if the post is not an event.
+        None if no usable answer was obtained (request failed, response was cut off
+        at the token limit, could not be parsed or lacked the details of an event),
+        so the post can be analyzed again later.
+    """
+    config = config or _get_default_config()
+    
+    cache_key = _analysis_cache_key(content, post_date, author, config)
+    cached = _get_cached_analysis(cache_key)
+    if cached is not None:
+        logger.debug("Using cached LLM analysis for post")
+        return cached
+    
+    try:
+        openai = init_openai_client()
+        
+        # Prepare content with metadata
+        content_with_metadata = _format_post_with_metadata(content, post_date, author)
+        
+        response = openai.chat.completions.create(
+            model=config['model'],
+            temperature=config['temperature'],
+            max_tokens=_get_analysis_max_tokens(config),
+            **_get_response_format_kwargs(config),
+            messages=[
+                {"role": "system", "content": SYSTEM_CLASSIFY_AND_EXTRACT},
+                {
+                    "role": "user",
+                    "content": (
+                        f"Is this post about an event? Please respond with a JSON object containing:\n"
+                        f"- 'is_event': Boolean, whether the post is about an event\n"
+                        f"- 'explanation': Short explanation of the decision\n"
+                        f"- 'details': null if the post is not an event, otherwise an object containing:\n"
+                        f"  - 'title': The event title\n"
+                        f"  - 'description': Full event description\n"
+                        f"  - 'start_time': Start time in ISO format (YYYY-MM-DDTHH:MM:SS)\n"
+                        f"  - 'end_time': End time in ISO format (optional)\n"
+                        f"  - 'location': Event location (optional)\n"
+                        f"  - 'food': Food/refreshments info (optional)\n"
+                        f"  - 'registration_info': Registration details (optional)\n\n"
+                        f"Post:\n\n{content_with_metadata}\n\nPost URL: {url}"
+                    )
+                }
+            ]
+        )
+        
+        # A response cut off at the token limit is incomplete JSON, not a "no"
+        choice = response.choices[0]
+        if choice.finish_reason == 'length':
+            logger.error(f"LLM response was cut off at the token limit for post: {url}")
+            return None
+        
+        # Get the response content and ensure it's valid JSON
+        response_text = choice.message.content.strip()
+        result = _extract_json_from_response(response_text)
+        if not result or 'is_event' not in result:
+            logger.error(f"Invalid response format: {response_text}")
+            return None
+        
+        if not result['is_event']:
+            analysis = (False, None)
+        else:
+            details = result.get('details')
+            if not isinstance(details, dict):
+                logger.error(f"Missing event details in response: {response_text}")
+                return None
+            analysis = (True, details)
+        
+        _cache_analysis(cache_key, analysis)
+        return analysis
+        
+    except Exception as e:
+        logger.error(f"Error in classify_and_parse: {e}")
+        return None
+
+def classify_and_parse_many(
+    posts: List[Dict[str, Any]],
+    config: Optional[Dict[str, Any]] = None
+) -> List[Optional[Tuple[bool, Optional[Dict[str, Any]]]]]:
+    """
+    Run classify_and_parse for many posts concurrently.
+    
+    LLM calls are network-bound, so they are spread over a thread pool bounded by
+    the configured max_parallel_requests (OPENAI_MAX_PARALLEL).
+    
+    Args:
+        posts: List of keyword arguments for classify_and_parse, each containing
+              'content' and 'url', and optionally 'post_date' and 'author'
+        config: Optional LLM configuration. If not provided, uses default config
+    
+    Returns:
+        List of classify_and_parse results (an (is_event, event_details) tuple,
+        or None if the analysis failed) in the same order as posts
+    """
+    if not posts:
+        return []
+    
+    max_workers = min((config or _get_default_config())['max_parallel_requests'], len(posts))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda post: classify_and_parse(config=config, **post), posts))
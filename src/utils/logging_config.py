@@ -1,6 +1,9 @@
 """Logging configuration for the application."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
 def setup_logging():
@@ -14,10 +17,17 @@ def setup_logging():
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     
+    # Hand records to a background thread for the stdout write. Messages are still
+    # formatted on the logging thread (QueueHandler.prepare); only the I/O moves off it
+    log_queue = queue.SimpleQueue()
+    queue_listener = logging.handlers.QueueListener(log_queue, console_handler)
+    queue_listener.start()
+    atexit.register(queue_listener.stop)
+    
     # Configure the root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Set higher log levels for noisy components
     logging.getLogger('httpcore').setLevel(logging.WARNING)
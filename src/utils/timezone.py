@@ -1,12 +1,19 @@
 """Timezone utilities for the application."""
 
+import logging
+import sys
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 # Default timezone for the application
 DEFAULT_TIMEZONE = ZoneInfo("Europe/Oslo")
 
+# datetime.fromisoformat accepts a trailing 'Z' (UTC) natively from Python 3.11
+_FROMISOFORMAT_HANDLES_Z = sys.version_info >= (3, 11)
+
 def ensure_oslo_timezone(dt: Optional[datetime]) -> Optional[datetime]:
     """
     Ensure datetime is in Oslo timezone.
@@ -33,4 +40,66 @@ def now_oslo() -> datetime:
 
 def is_timezone_aware(dt: Optional[datetime]) -> bool:
     """Check if a datetime is timezone-aware."""
-    return dt is not None and dt.tzinfo is not None 
\ No newline at end of file
+    return dt is not None and dt.tzinfo is not None 
+
+def looks_like_iso_datetime(value: object) -> bool:
+    """
+    Cheap structural check for an ISO 8601 date or datetime string.
+    
+    Lets callers reject obvious garbage (numbers, empty objects, free text)
+    without going through the much slower exception path of a failed parse.
+    
+    Args:
+        value: Value to check
+    
+    Returns:
+        True if value is a string starting with a digit (extended YYYY-MM-DD
+        and basic YYYYMMDD forms both qualify; fromisoformat does the full check)
+    """
+    return isinstance(value, str) and value[:1].isdigit()
+
+def parse_iso_datetime(date_str: str) -> datetime:
+    """
+    Parse an ISO 8601 datetime string, including a trailing 'Z' for UTC.
+    
+    Args:
+        date_str: ISO formatted datetime string (e.g., "2024-03-19T14:30:00.000Z")
+    
+    Returns:
+        Parsed datetime (timezone-aware if the string carries an offset)
+    
+    Raises:
+        ValueError: If the string is not a valid ISO datetime
+    """
+    if _FROMISOFORMAT_HANDLES_Z:
+        return datetime.fromisoformat(date_str)
+    if date_str.endswith('Z'):
+        date_str = date_str[:-1] + '+00:00'
+    return datetime.fromisoformat(date_str)
+
+def parse_oslo_datetime(date_str: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 datetime string into a datetime in Oslo timezone.
+    
+    Shared by the data processors for dates coming from scraped data or LLM output.
+    Strings without an offset are taken as Oslo local time (no conversion needed).
+    
+    Args:
+        date_str: Date string to parse (e.g., "2017-11-03T17:00:00.000Z")
+    
+    Returns:
+        Datetime in Oslo timezone, or None if the string is empty or cannot be parsed
+    """
+    if not date_str:
+        return None
+    
+    # Reject malformed values up front instead of raising and catching ValueError
+    if not looks_like_iso_datetime(date_str):
+        logger.warning(f"Could not parse date string: {date_str}")
+        return None
+    
+    try:
+        return ensure_oslo_timezone(parse_iso_datetime(date_str))
+    except ValueError:
+        logger.warning(f"Could not parse date string: {date_str}")
+        return None